@@ -1,15 +1,40 @@
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from typing import Iterable, Literal
 
 from app.diff_parser import FileDiff
 
+logger = logging.getLogger(__name__)
+
 Severity = Literal["high", "medium", "low"]
 SEVERITY_RANK = {"high": 0, "medium": 1, "low": 2}
 
+_WITHIN_SEVERITY_ORDER = attrgetter("path", "line", "rule_id")
+
+# PRs touching fewer files than this are analyzed inline; for them, shipping
+# diffs to worker processes costs more than the analysis itself.
+PARALLEL_MIN_FILES = int(os.getenv("ANALYZER_PARALLEL_MIN_FILES", "64"))
+# Worker processes per pool. CPU affinity (taskset, cpusets) is honoured,
+# unlike os.cpu_count(), which reports every CPU on the host.
+_POOL_WORKERS = (
+    len(os.sched_getaffinity(0))
+    if hasattr(os, "sched_getaffinity")
+    else os.cpu_count() or 1
+)
+# Starting the worker pool at startup only pays off for deployments that
+# regularly see PRs that large, so it is opt-in.
+WARM_UP_POOL = os.getenv("ANALYZER_WARM_UP", "false").lower() in ("1", "true", "yes")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     path: str
     line: int
@@ -19,24 +44,134 @@ class Finding:
     snippet: str
 
 
+# Severity and message per rule id. Messages with ``%`` placeholders take the
+# extra arguments passed to ``make_finding``.
+RULE_TEMPLATES: dict[str, tuple[Severity, str]] = {
+    "TRAILING_WHITESPACE": ("low", "Line has trailing whitespace."),
+    "LINE_TOO_LONG": ("low", "Line length is %d characters (limit: %d)."),
+    "TODO_COMMENT": ("low", "TODO/FIXME marker found in changed line."),
+    "PY_DEBUG_PRINT": ("low", "Debug print statement found in changed line."),
+    "PY_TAB_INDENT": (
+        "medium",
+        "Tab character used for indentation in Python code.",
+    ),
+    "JS_DEBUG_LOG": ("low", "Debug console.log statement found in changed line."),
+    "PY_EVAL_USAGE": ("high", "Avoid `eval()` on changed lines; use safer parsing."),
+    "PY_EXEC_USAGE": ("high", "Avoid `exec()` on changed lines."),
+    "PY_SUBPROCESS_SHELL_TRUE": (
+        "high",
+        "subprocess with shell=True on changed line may enable command injection.",
+    ),
+    "PY_PICKLE_LOAD": (
+        "medium",
+        "pickle.loads/load can execute arbitrary code on untrusted input.",
+    ),
+    "PY_YAML_LOAD": ("medium", "Use yaml.safe_load instead of yaml.load."),
+    "COMPLEX_BOOLEAN_EXPRESSION": (
+        "medium",
+        "Changed line has a dense boolean expression; "
+        "consider extracting named sub-expressions.",
+    ),
+    "DEEP_NESTING": (
+        "low",
+        "Changed control-flow line appears deeply nested; consider refactoring.",
+    ),
+    "NESTED_TERNARY": (
+        "medium",
+        "Nested ternary detected on changed line; consider clearer control flow.",
+    ),
+}
+
+
+def make_finding(
+    rule_id: str, path: str, line: int, snippet: str, *details: object
+) -> Finding:
+    severity, message = RULE_TEMPLATES[rule_id]
+    if details:
+        message = message % details
+    return Finding(path, line, severity, rule_id, message, snippet)
+
+
 def run_all_analyzers(file_diffs: Iterable[FileDiff]) -> list[Finding]:
+    from .fused import fused_findings
+
     file_diffs_list = list(file_diffs)
+    # With a single usable CPU the workers would run the same serial work,
+    # plus the cost of shipping diffs and findings between processes.
+    if len(file_diffs_list) < PARALLEL_MIN_FILES or _POOL_WORKERS < 2:
+        findings = fused_findings(file_diffs_list)
+    else:
+        findings = _parallel_findings(file_diffs_list)
+
+    # Severity has only a handful of values: bucket by it in one pass, then
+    # sort each bucket on the remaining key with a C-level attrgetter.
+    ranked = sorted(SEVERITY_RANK, key=SEVERITY_RANK.__getitem__)
+    buckets: dict[str, list[Finding]] = {severity: [] for severity in ranked}
+    unranked: list[Finding] = []
+    for finding in findings:
+        buckets.get(finding.severity, unranked).append(finding)
+
+    ordered: list[Finding] = []
+    for bucket in (*buckets.values(), unranked):
+        bucket.sort(key=_WITHIN_SEVERITY_ORDER)
+        ordered.extend(bucket)
+    return ordered
+
+
+def warm_up_analyzers() -> None:
+    """Start the analyzer worker processes before the first large PR arrives.
+
+    Does nothing unless ``ANALYZER_WARM_UP`` is enabled and at least two CPUs
+    are usable; otherwise the pool is started by the first PR with at least
+    ``PARALLEL_MIN_FILES`` files, if ever.
+    """
+    if not WARM_UP_POOL or _POOL_WORKERS < 2:
+        return
+
+    pool = _get_process_pool()
+    # One no-op task per worker so every process is already forked and idle.
+    list(pool.map(abs, range(_POOL_WORKERS)))
+
+
+def shutdown_analyzers() -> None:
+    """Stop the analyzer worker processes, if any were started."""
+    if _get_process_pool.cache_info().currsize:
+        _get_process_pool().shutdown(cancel_futures=True)
+        _get_process_pool.cache_clear()
+
+
+def _parallel_findings(file_diffs: list[FileDiff]) -> list[Finding]:
+    from .fused import fused_findings
+
+    pool = _get_process_pool()
     findings: list[Finding] = []
+    try:
+        for file_findings in pool.map(_analyze_single_file, file_diffs, chunksize=8):
+            findings.extend(file_findings)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed) and the pool cannot be used again.
+        # Drop it so the next large PR gets a fresh one; finish this one inline.
+        logger.warning("Analyzer process pool is broken; analyzing inline")
+        _get_process_pool.cache_clear()
+        pool.shutdown(wait=False, cancel_futures=True)
+        return fused_findings(file_diffs)
+    return findings
+
+
+def _analyze_single_file(file_diff: FileDiff) -> list[Finding]:
+    from .fused import fused_findings
+
+    return fused_findings((file_diff,))
+
 
-    from .complexity import complexity_findings
-    from .lint import lint_findings
-    from .python_ast import python_security_findings
-
-    findings.extend(lint_findings(file_diffs_list))
-    findings.extend(python_security_findings(file_diffs_list))
-    findings.extend(complexity_findings(file_diffs_list))
-
-    return sorted(
-        findings,
-        key=lambda finding: (
-            SEVERITY_RANK.get(finding.severity, 99),
-            finding.path,
-            finding.line,
-            finding.rule_id,
-        ),
-    )
+@lru_cache(maxsize=1)
+def _get_process_pool() -> ProcessPoolExecutor:
+    # Never fork this process directly: by the time a pool is (re)built it
+    # runs other threads. A forkserver preloads the rules once and forks
+    # workers from its own single-threaded process.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["app.analyzers.fused"])
+    else:
+        context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=_POOL_WORKERS, mp_context=context)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from app.diff_parser import FileDiff
+
+from . import Finding, make_finding
+from .complexity import MULTI_TERNARY_RE, NESTING_PREFIXES
+from .lint import JSTS_LANGUAGES, MAX_LINE_LENGTH, PRINT_PREFIX, TODO_RE
+from .python_ast import PY_SECURITY_PREFILTER_RE, SUBPROCESS_SHELL_RE, has_call
+
+
+def fused_findings(file_diffs: Iterable[FileDiff]) -> list[Finding]:
+    """Run lint, Python security and complexity rules in one pass per line.
+
+    The rule patterns live in ``lint``, ``python_ast`` and ``complexity``;
+    every changed line is read, stripped and measured once for all of them.
+    """
+    findings: list[Finding] = []
+    append = findings.append
+    todo_search = TODO_RE.search
+    max_line_length = MAX_LINE_LENGTH
+    ternary_search = MULTI_TERNARY_RE.search
+    subprocess_search = SUBPROCESS_SHELL_RE.search
+    py_sec_prefilter = PY_SECURITY_PREFILTER_RE.search
+
+    for file_diff in file_diffs:
+        path = file_diff.path
+        # Rule families are language-gated; decide once per file.
+        is_python = file_diff.language == "python"
+        is_jsts = file_diff.language in JSTS_LANGUAGES
+
+        for number, text in zip(file_diff.line_numbers, file_diff.contents):
+            stripped = text.strip()
+            snippet = (stripped or "<empty line>")[:160]
+
+            # Lint rules.
+            if text.rstrip(" \t") != text:
+                append(make_finding("TRAILING_WHITESPACE", path, number, snippet))
+
+            if len(text) > max_line_length:
+                append(
+                    make_finding(
+                        "LINE_TOO_LONG",
+                        path,
+                        number,
+                        snippet,
+                        len(text),
+                        max_line_length,
+                    )
+                )
+
+            if todo_search(text):
+                append(make_finding("TODO_COMMENT", path, number, snippet))
+
+            if is_python:
+                if stripped.startswith(PRINT_PREFIX):
+                    append(make_finding("PY_DEBUG_PRINT", path, number, snippet))
+
+                indentation = text[: len(text) - len(text.lstrip(" \t"))]
+                if "\t" in indentation:
+                    append(make_finding("PY_TAB_INDENT", path, number, snippet))
+
+                # Python security rules; each one matches a call on one of a
+                # few names, so most lines are ruled out before any rule runs.
+                if "(" in text and py_sec_prefilter(text):
+                    if has_call(text, "eval"):
+                        append(make_finding("PY_EVAL_USAGE", path, number, snippet))
+
+                    if has_call(text, "exec"):
+                        append(make_finding("PY_EXEC_USAGE", path, number, snippet))
+
+                    if subprocess_search(text):
+                        append(
+                            make_finding(
+                                "PY_SUBPROCESS_SHELL_TRUE", path, number, snippet
+                            )
+                        )
+
+                    if has_call(text, "pickle.load", allow_space=False) or has_call(
+                        text, "pickle.loads", allow_space=False
+                    ):
+                        append(make_finding("PY_PICKLE_LOAD", path, number, snippet))
+
+                    if has_call(text, "yaml.load") and "safe_load" not in text:
+                        append(make_finding("PY_YAML_LOAD", path, number, snippet))
+
+            elif is_jsts:
+                if "console.log(" in stripped:
+                    append(make_finding("JS_DEBUG_LOG", path, number, snippet))
+
+            # Complexity rules.
+            if not stripped:
+                continue
+
+            # Most lines have no boolean operators; skip both counts for them.
+            if " and " in stripped or " or " in stripped:
+                and_count = stripped.count(" and ")
+                if and_count >= 3 or and_count + stripped.count(" or ") >= 3:
+                    append(
+                        make_finding(
+                            "COMPLEX_BOOLEAN_EXPRESSION", path, number, snippet
+                        )
+                    )
+
+            indent_len = len(text) - len(text.lstrip(" "))
+            if indent_len >= 16 and stripped.startswith(NESTING_PREFIXES):
+                append(make_finding("DEEP_NESTING", path, number, snippet))
+
+            if is_jsts and ternary_search(stripped):
+                append(make_finding("NESTED_TERNARY", path, number, snippet))
+
+    return findings
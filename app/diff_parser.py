@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-import os
 import re
+from array import array
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, NamedTuple, overload
 
 HUNK_HEADER_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+# Bytes twin of HUNK_HEADER_RE for parse_patch. There is no ``^`` because it
+# is applied with ``match(data, pos, end)``, which already anchors at ``pos``.
+HUNK_HEADER_BYTES_RE = re.compile(rb"@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+
+_PLUS, _MINUS, _AT, _BACKSLASH, _CR = b"+-@\\\r"
 
 LANGUAGE_BY_EXTENSION = {
     ".c": "c",
@@ -30,54 +35,111 @@ LANGUAGE_BY_EXTENSION = {
 }
 
 
-@dataclass(frozen=True)
-class ChangedLine:
+class ChangedLine(NamedTuple):
     number: int
     content: str
 
 
+class ChangedLinesView:
+    """Read-only ``ChangedLine`` sequence over a FileDiff's line columns."""
+
+    __slots__ = ("_numbers", "_contents")
+
+    def __init__(self, numbers: array, contents: list[str]) -> None:
+        self._numbers = numbers
+        self._contents = contents
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def __iter__(self) -> Iterator[ChangedLine]:
+        return map(ChangedLine, self._numbers, self._contents)
+
+    @overload
+    def __getitem__(self, index: int) -> ChangedLine: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ChangedLine]: ...
+
+    def __getitem__(self, index: int | slice) -> ChangedLine | list[ChangedLine]:
+        if isinstance(index, slice):
+            return list(map(ChangedLine, self._numbers[index], self._contents[index]))
+        return ChangedLine(self._numbers[index], self._contents[index])
+
+
 @dataclass(frozen=True)
 class FileDiff:
     path: str
     language: str
     additions: int
     deletions: int
-    changed_lines: list[ChangedLine]
+    # Changed lines are stored column-wise: analyzers walk both columns in
+    # lockstep, and most lines never need a ChangedLine object of their own.
+    line_numbers: array
+    contents: list[str]
 
-
-def detect_language(file_path: str) -> str:
-    _, extension = os.path.splitext(file_path.lower())
-    return LANGUAGE_BY_EXTENSION.get(extension, "text")
+    @property
+    def changed_lines(self) -> ChangedLinesView:
+        return ChangedLinesView(self.line_numbers, self.contents)
 
 
-def parse_patch(patch: str) -> list[ChangedLine]:
-    changed_lines: list[ChangedLine] = []
+def detect_language(file_path: str) -> str:
+    dot = file_path.rfind(".")
+    name_start = file_path.rfind("/") + 1
+    # Same rule as os.path.splitext: leading dots of the file name (".env",
+    # "..py") do not start an extension. Only the extension is lowercased.
+    if dot <= name_start or not file_path[name_start:dot].lstrip("."):
+        return "text"
+    return LANGUAGE_BY_EXTENSION.get(file_path[dot:].lower(), "text")
+
+
+def parse_patch(patch: str) -> tuple[array, list[str]]:
+    """Return the new-file line numbers and contents of the patch's added lines."""
+    # Walk the patch as bytes, one "\n"-terminated line at a time, dispatching
+    # on the first byte. Only added lines are decoded back to ``str``; context
+    # and removed lines are never materialized.
+    line_numbers = array("i")
+    contents: list[str] = []
     new_line_number = 0
 
-    for raw_line in patch.splitlines():
-        if raw_line.startswith("@@"):
-            match = HUNK_HEADER_RE.match(raw_line)
-            if not match:
-                continue
-            new_line_number = int(match.group(1))
+    data = patch.encode("utf-8", "surrogatepass")
+    find = data.find
+    size = len(data)
+    pos = 0
+
+    while pos < size:
+        end = find(b"\n", pos)
+        if end < 0:
+            end = size
+        next_pos = end + 1
+        first = data[pos]
+
+        if first == _AT and data.startswith(b"@@", pos):
+            match = HUNK_HEADER_BYTES_RE.match(data, pos, end)
+            if match:
+                new_line_number = int(match.group(1))
+            pos = next_pos
             continue
 
-        if raw_line.startswith("+") and not raw_line.startswith("+++"):
-            changed_lines.append(
-                ChangedLine(number=new_line_number, content=raw_line[1:])
-            )
+        if first == _PLUS and not data.startswith(b"+++", pos):
+            if end > pos + 1 and data[end - 1] == _CR:
+                end -= 1
+            line_numbers.append(new_line_number)
+            contents.append(data[pos + 1 : end].decode("utf-8", "surrogatepass"))
             new_line_number += 1
+            pos = next_pos
             continue
 
-        if raw_line.startswith("-") and not raw_line.startswith("---"):
-            continue
-
-        if raw_line.startswith("\\"):
+        if (first == _MINUS and not data.startswith(b"---", pos)) or (
+            first == _BACKSLASH
+        ):
+            pos = next_pos
             continue
 
         new_line_number += 1
+        pos = next_pos
 
-    return changed_lines
+    return line_numbers, contents
 
 
 def build_file_diffs(files_payload: Iterable[dict[str, Any]]) -> list[FileDiff]:
@@ -92,8 +154,8 @@ def build_file_diffs(files_payload: Iterable[dict[str, Any]]) -> list[FileDiff]:
             # Binary files and very large patches may not include a patch body.
             continue
 
-        changed_lines = parse_patch(str(patch))
-        if not changed_lines:
+        line_numbers, contents = parse_patch(str(patch))
+        if not contents:
             continue
 
         diffs.append(
@@ -102,7 +164,8 @@ def build_file_diffs(files_payload: Iterable[dict[str, Any]]) -> list[FileDiff]:
                 language=detect_language(path),
                 additions=int(changed_file.get("additions", 0) or 0),
                 deletions=int(changed_file.get("deletions", 0) or 0),
-                changed_lines=changed_lines,
+                line_numbers=line_numbers,
+                contents=contents,
             )
         )
 
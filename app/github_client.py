@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
 
 import httpx
 import jwt
 
+FILES_PER_PAGE = 100
+# The pull request files endpoint lists at most 3000 files.
+MAX_LISTED_FILES = 3000
+MAX_KEEPALIVE_CONNECTIONS = 16
+# Page fetches in flight per PR. Kept low: GitHub's secondary rate limits
+# penalize bursts of concurrent requests from one installation token.
+MAX_CONCURRENT_PAGE_REQUESTS = 4
+
 
 class GitHubApiError(RuntimeError):
     """Raised when GitHub API returns an error response."""
@@ -26,6 +36,20 @@ class GitHubAppClient:
         self.webhook_secret = webhook_secret
         self.api_url = api_url.rstrip("/")
         self.timeout_seconds = timeout_seconds
+        # App JWTs are valid for ~10 minutes; reuse one instead of re-signing
+        # (an RSA private-key operation) on every app-authenticated request.
+        self._cached_jwt: tuple[str, int] | None = None
+        self._jwt_lock = threading.Lock()
+        # One pooled client for the lifetime of the app: keep-alive and HTTP/2
+        # avoid a TCP + TLS handshake per API call.
+        self._client = httpx.Client(
+            timeout=timeout_seconds,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+        )
+
+    def close(self) -> None:
+        self._client.close()
 
     @classmethod
     def from_env(cls) -> "GitHubAppClient":
@@ -59,14 +83,21 @@ class GitHubAppClient:
         )
 
     def _create_app_jwt(self) -> str:
-        now = int(time.time())
-        payload = {
-            "iat": now - 60,
-            "exp": now + 9 * 60,
-            "iss": self.app_id,
-        }
-        token = jwt.encode(payload, self.private_key, algorithm="RS256")
-        return str(token)
+        with self._jwt_lock:
+            now = int(time.time())
+            cached = self._cached_jwt
+            if cached and cached[1] - now > 60:
+                return cached[0]
+
+            expires_at = now + 9 * 60
+            payload = {
+                "iat": now - 60,
+                "exp": expires_at,
+                "iss": self.app_id,
+            }
+            token = str(jwt.encode(payload, self.private_key, algorithm="RS256"))
+            self._cached_jwt = (token, expires_at)
+            return token
 
     def _request(
         self,
@@ -89,14 +120,13 @@ class GitHubAppClient:
         elif installation_token:
             headers["Authorization"] = f"Bearer {installation_token}"
 
-        with httpx.Client(timeout=self.timeout_seconds) as client:
-            response = client.request(
-                method=method,
-                url=f"{self.api_url}{path}",
-                headers=headers,
-                params=params,
-                json=json_body,
-            )
+        response = self._client.request(
+            method=method,
+            url=f"{self.api_url}{path}",
+            headers=headers,
+            params=params,
+            json=json_body,
+        )
 
         expected = expected_statuses or set()
         if expected:
@@ -140,25 +170,46 @@ class GitHubAppClient:
         repo: str,
         pr_number: int,
         installation_token: str,
+        total_files: int | None = None,
     ) -> list[dict[str, Any]]:
-        files: list[dict[str, Any]] = []
-        page = 1
-        while True:
+        def fetch_page(page: int) -> list[dict[str, Any]]:
             page_files = self._request(
                 method="GET",
                 path=f"/repos/{owner}/{repo}/pulls/{pr_number}/files",
                 installation_token=installation_token,
-                params={"per_page": 100, "page": page},
+                params={"per_page": FILES_PER_PAGE, "page": page},
                 expected_statuses={200},
             )
             if not isinstance(page_files, list):
                 raise GitHubApiError(
                     "Unexpected response while fetching pull request files"
                 )
-            files.extend(page_files)
-            if len(page_files) < 100:
-                break
+            return page_files
+
+        page = 1
+        page_files = fetch_page(page)
+        files: list[dict[str, Any]] = list(page_files)
+
+        # When the PR's file count is known (``changed_files`` on the webhook
+        # payload), fetch the remaining pages concurrently over the pooled
+        # client instead of one round trip at a time.
+        if len(page_files) == FILES_PER_PAGE and total_files:
+            last_page = min(
+                -(-total_files // FILES_PER_PAGE), MAX_LISTED_FILES // FILES_PER_PAGE
+            )
+            if last_page > page:
+                pages = range(page + 1, last_page + 1)
+                workers = min(len(pages), MAX_CONCURRENT_PAGE_REQUESTS)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for page_files in executor.map(fetch_page, pages):
+                        files.extend(page_files)
+                page = last_page
+
+        # Keep paging serially if the PR grew past the advertised count.
+        while len(page_files) == FILES_PER_PAGE:
             page += 1
+            page_files = fetch_page(page)
+            files.extend(page_files)
         return files
 
     def post_pull_request_review(
@@ -169,7 +220,7 @@ class GitHubAppClient:
         commit_sha: str,
         installation_token: str,
         review_body: str,
-        inline_comments: list[dict[str, Any]],
+        inline_comments: Sequence[dict[str, Any]],
     ) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "commit_id": commit_sha,
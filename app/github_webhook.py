@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import hashlib
 import hmac
 
 
 def validate_webhook_signature(
-    webhook_secret: str,
+    webhook_secret: str | bytes,
     payload: bytes,
     signature_header: str | None,
     *,
@@ -15,7 +14,8 @@ def validate_webhook_signature(
     Validate GitHub webhook signature using X-Hub-Signature-256.
 
     Args:
-        webhook_secret: GitHub webhook secret (raw string, no quotes)
+        webhook_secret: GitHub webhook secret (raw string, no quotes), or its
+            UTF-8 encoding
         payload: Raw request body bytes
         signature_header: Value of X-Hub-Signature-256 header
         is_github_delivery: Set False for local/manual tests (Windows-safe)
@@ -28,7 +28,7 @@ def validate_webhook_signature(
     if not webhook_secret or not signature_header:
         return False
 
-    if not signature_header.startswith("sha256="):
+    if signature_header[:7] != "sha256=":
         return False
 
     # Windows / manual test fix:
@@ -36,15 +36,15 @@ def validate_webhook_signature(
     if not is_github_delivery:
         payload = payload.rstrip(b"\r\n")
 
-    # Compute expected digest
-    expected_digest = hmac.new(
-        webhook_secret.encode("utf-8"),
-        msg=payload,
-        digestmod=hashlib.sha256,
-    ).hexdigest()
+    # Compute expected digest (single-shot OpenSSL HMAC, raw bytes)
+    if isinstance(webhook_secret, str):
+        webhook_secret = webhook_secret.encode("utf-8")
+    expected_digest = hmac.digest(webhook_secret, payload, "sha256")
 
-    # Extract received digest (remove 'sha256=')
-    received_digest = signature_header.split("=", 1)[1]
+    # Extract received digest (remove 'sha256='). It is compared as text, so
+    # only GitHub's exact form (64 lowercase hex characters) can match;
+    # bytes.fromhex would also accept uppercase and embedded whitespace.
+    received_digest = signature_header[7:].encode("utf-8")
 
     # Constant-time comparison
-    return hmac.compare_digest(expected_digest, received_digest)
+    return hmac.compare_digest(expected_digest.hex().encode("ascii"), received_digest)
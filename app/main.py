@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
+from contextlib import asynccontextmanager
 from functools import lru_cache
-from typing import Any
+from typing import Any, AsyncIterator
+
+import orjson
 from dotenv import load_dotenv,find_dotenv
 from fastapi import FastAPI, Header, HTTPException, Request
 
-from app.analyzers import run_all_analyzers
+from app.analyzers import (
+    run_all_analyzers,
+    shutdown_analyzers,
+    warm_up_analyzers,
+)
 from app.diff_parser import build_file_diffs
 from app.github_client import GitHubApiError, GitHubAppClient
 from app.github_webhook import validate_webhook_signature
@@ -23,7 +29,20 @@ logging.basicConfig(
 logger = logging.getLogger("siege-gatekeeper")
 
 SUPPORTED_PR_ACTIONS = {"opened", "reopened", "synchronize", "ready_for_review"}
-app = FastAPI(title="SieGe Gatekeeper", version="1.0.0")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Optionally start analyzer workers now so the first large PR doesn't
+    # pay for it (ANALYZER_WARM_UP).
+    warm_up_analyzers()
+    yield
+    shutdown_analyzers()
+    if get_github_client.cache_info().currsize:
+        get_github_client().close()
+
+
+app = FastAPI(title="SieGe Gatekeeper", version="1.0.0", lifespan=lifespan)
 
 
 @lru_cache(maxsize=1)
@@ -31,6 +50,12 @@ def get_github_client() -> GitHubAppClient:
     return GitHubAppClient.from_env()
 
 
+@lru_cache(maxsize=1)
+def get_webhook_secret() -> bytes:
+    # Encoded once; every signature check hashes with these bytes.
+    return os.getenv("GITHUB_WEBHOOK_SECRET", "").encode("utf-8")
+
+
 @app.get("/healthz")
 def healthz() -> dict[str, str]:
     return {"status": "ok"}
@@ -46,7 +71,7 @@ async def handle_webhook(
 
     payload_bytes = await request.body()
     
-    webhook_secret = os.getenv("GITHUB_WEBHOOK_SECRET")
+    webhook_secret = get_webhook_secret()
     if not webhook_secret:
         raise HTTPException(
             status_code=500,
@@ -67,8 +92,8 @@ async def handle_webhook(
 
     # Parse JSON payload
     try:
-        payload = json.loads(payload_bytes)
-    except json.JSONDecodeError as exc:
+        payload = orjson.loads(payload_bytes)
+    except orjson.JSONDecodeError as exc:
         raise HTTPException(status_code=400, detail="Invalid JSON payload") from exc
 
     # Only handle pull request events
@@ -114,6 +139,7 @@ async def handle_webhook(
             repo=repo,
             pr_number=int(pr_number),
             installation_token=installation_token,
+            total_files=int(pull_request.get("changed_files") or 0),
         )
 
         file_diffs = build_file_diffs(pr_files)
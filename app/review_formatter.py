@@ -2,19 +2,62 @@ from __future__ import annotations
 
 import os
 from collections import Counter
-from typing import Iterable
+from collections.abc import Sized
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import Iterable, Sequence
 
 from app.analyzers import Finding
 from app.diff_parser import FileDiff
 
+_PIPE_ESCAPE = str.maketrans({"|": "\\|"})
+_SEV_UPPER = {"high": "HIGH", "medium": "MEDIUM", "low": "LOW"}
+_EMPTY_LINE = "`<empty line>`"
+# Findings table row: path, line, severity, rule id, message.
+_ROW_FMT = "| `%s` | %d | %s | `%s` | %s |"
+# Truncation notices, each preceded by a blank line once the body is joined.
+_TABLE_TRUNC = (
+    "\n_Table truncated to first %d findings; "
+    "%d additional finding(s) included in summary only._"
+)
+_COMMENT_TRUNC = (
+    "\n_Inline comments limited to %d lines (config `MAX_INLINE_COMMENTS=%d`)._"
+)
+# One entry per changed line; cheaper to measure than the changed_lines view.
+_LINE_CONTENTS = attrgetter("contents")
+_SEVERITY = attrgetter("severity")
+
+# Review preamble up to the findings table header. Placeholders: files, changed
+# lines and findings analyzed, then the HIGH, MEDIUM and LOW counts.
+_HEADER_TEMPLATE = (
+    "## SieGe Gatekeeper Review\n\n"
+    "### Scope\n"
+    "- Files analyzed: %d\n"
+    "- Changed lines analyzed: %d\n"
+    "- Findings: %d\n\n"
+    "### Severity Breakdown\n"
+    "| Severity | Count |\n"
+    "| --- | ---: |\n"
+    "| HIGH | %d |\n"
+    "| MEDIUM | %d |\n"
+    "| LOW | %d |\n\n"
+    "### Findings (Changed Lines Only)\n"
+    "| File | Line | Severity | Rule | Message |\n"
+    "| --- | ---: | --- | --- | --- |"
+)
+
 
 def build_review_payload(
     findings: Iterable[Finding],
     file_diffs: Iterable[FileDiff],
-) -> tuple[str, list[dict[str, object]]]:
-    findings_list = list(findings)
-    diffs_list = list(file_diffs)
-    changed_lines_count = sum(len(file_diff.changed_lines) for file_diff in diffs_list)
+) -> tuple[str, tuple[dict[str, object], ...]]:
+    # Findings are only read, so lists and tuples are used without a copy.
+    findings_list: Sequence[Finding] = (
+        findings if isinstance(findings, (list, tuple)) else list(findings)
+    )
+    n_findings = len(findings_list)
+    n_diffs, changed_lines_count = _diff_totals(file_diffs)
 
     max_inline_comments = _env_int("MAX_INLINE_COMMENTS", 50)
 
@@ -22,109 +65,120 @@ def build_review_payload(
         body = (
             "## SieGe Gatekeeper Review\n\n"
             "### Scope\n"
-            f"- Files analyzed: {len(diffs_list)}\n"
+            f"- Files analyzed: {n_diffs}\n"
             f"- Changed lines analyzed: {changed_lines_count}\n\n"
             "### Result\n"
             "No issues found on changed lines."
         )
-        return body, []
-
-    severity_counts = Counter(finding.severity for finding in findings_list)
-    body_lines: list[str] = [
-        "## SieGe Gatekeeper Review",
-        "",
-        "### Scope",
-        f"- Files analyzed: {len(diffs_list)}",
-        f"- Changed lines analyzed: {changed_lines_count}",
-        f"- Findings: {len(findings_list)}",
-        "",
-        "### Severity Breakdown",
-        "| Severity | Count |",
-        "| --- | ---: |",
-        f"| HIGH | {severity_counts.get('high', 0)} |",
-        f"| MEDIUM | {severity_counts.get('medium', 0)} |",
-        f"| LOW | {severity_counts.get('low', 0)} |",
-        "",
-        "### Findings (Changed Lines Only)",
-        "| File | Line | Severity | Rule | Message |",
-        "| --- | ---: | --- | --- | --- |",
-    ]
+        return body, ()
 
+    # The table shows only the first few findings; read them through islice
+    # so neither a slice copy nor a per-finding row-count check is needed.
     max_table_rows = 40
-    for finding in findings_list[:max_table_rows]:
-        body_lines.append(
-            "| "
-            f"`{_escape_cell(finding.path)}` | "
-            f"{finding.line} | "
-            f"{finding.severity.upper()} | "
-            f"`{_escape_cell(finding.rule_id)}` | "
-            f"{_escape_cell(finding.message)} |"
-        )
-
-    if len(findings_list) > max_table_rows:
-        body_lines.extend(
-            [
-                "",
-                (
-                    f"_Table truncated to first {max_table_rows} findings; "
-                    f"{len(findings_list) - max_table_rows} additional finding(s) "
-                    "included in summary only._"
-                ),
-            ]
-        )
-
-    inline_comments = _build_inline_comments(findings_list, limit=max_inline_comments)
-    if len(findings_list) > len(inline_comments):
-        body_lines.extend(
-            [
-                "",
-                (
-                    f"_Inline comments limited to {len(inline_comments)} lines "
-                    f"(config `MAX_INLINE_COMMENTS={max_inline_comments}`)._"
-                ),
-            ]
+    table_rows: list[str] = []
+    for finding in islice(findings_list, max_table_rows):
+        path, rule_id, message = finding.path, finding.rule_id, finding.message
+        # Pipes are rare; test the three text cells together and only escape
+        # them when one actually contains a pipe.
+        if "|" in path or "|" in rule_id or "|" in message:
+            path, rule_id, message = map(_escape_cell, (path, rule_id, message))
+        table_rows.append(
+            _ROW_FMT
+            % (
+                path,
+                finding.line,
+                _SEV_UPPER.get(finding.severity) or finding.severity.upper(),
+                rule_id,
+                message,
+            )
         )
 
-    return "\n".join(body_lines), inline_comments
-
-
-def _build_inline_comments(
-    findings: list[Finding], limit: int
-) -> list[dict[str, object]]:
-    if limit <= 0:
-        return []
-
-    comments: list[dict[str, object]] = []
-    seen: set[tuple[str, int, str]] = set()
+    # Walk the findings until the inline comments are capped, tallying
+    # severities and collecting the deduplicated comments on the way.
+    high = medium = low = 0
+    # Keyed on (path, line, rule_id): the first finding per key wins and the
+    # dict keeps insertion order, so no separate "seen" set is needed.
+    comments: dict[tuple[str, int, str], dict[str, object]] = {}
+
+    remaining = iter(findings_list)
+    for finding in remaining:
+        severity = finding.severity
+        if severity == "high":
+            high += 1
+        elif severity == "medium":
+            medium += 1
+        elif severity == "low":
+            low += 1
+
+        if len(comments) >= max_inline_comments:
+            break
 
-    for finding in findings:
         unique_key = (finding.path, finding.line, finding.rule_id)
-        if unique_key in seen:
-            continue
-        seen.add(unique_key)
-
-        comment_body = (
-            f"[{finding.severity.upper()}] {finding.message}\n\n"
-            f"`{finding.snippet or '<empty line>'}`"
-        )
-        comments.append(
-            {
+        if unique_key not in comments:
+            snippet = f"`{finding.snippet}`" if finding.snippet else _EMPTY_LINE
+            # The body is capped at 64000 characters; cutting the message
+            # first keeps a huge one from being copied in full only to be
+            # thrown away. The final cap still applies to the whole body.
+            comment_body = (
+                f"[{_SEV_UPPER.get(severity) or severity.upper()}] "
+                f"{finding.message[:64000]}\n\n{snippet}"
+            )
+            comments[unique_key] = {
                 "path": finding.path,
                 "line": finding.line,
                 "side": "RIGHT",
                 "body": comment_body[:64000],
             }
-        )
-        if len(comments) >= limit:
-            break
 
-    return comments
+    # The rest only need tallying, which Counter does without a Python loop.
+    tail_counts = Counter(map(_SEVERITY, remaining))
+    high += tail_counts["high"]
+    medium += tail_counts["medium"]
+    low += tail_counts["low"]
+
+    header = _HEADER_TEMPLATE % (
+        n_diffs,
+        changed_lines_count,
+        n_findings,
+        high,
+        medium,
+        low,
+    )
+    body_lines: list[str] = [header]
+    body_lines.extend(table_rows)
+
+    if n_findings > max_table_rows:
+        body_lines.append(_TABLE_TRUNC % (max_table_rows, n_findings - max_table_rows))
+
+    inline_comments = tuple(comments.values())
+    n_comments = len(inline_comments)
+    if n_findings > n_comments:
+        body_lines.append(_COMMENT_TRUNC % (n_comments, max_inline_comments))
+
+    return "\n".join(body_lines), inline_comments
+
+
+def _diff_totals(file_diffs: Iterable[FileDiff]) -> tuple[int, int]:
+    """Return the number of files and of changed lines, without copying."""
+    if isinstance(file_diffs, Sized):
+        return len(file_diffs), sum(map(len, map(_LINE_CONTENTS, file_diffs)))
+
+    # One-shot iterator: count both totals in the single pass it allows.
+    n_diffs = changed_lines_count = 0
+    for file_diff in file_diffs:
+        n_diffs += 1
+        changed_lines_count += len(file_diff.contents)
+    return n_diffs, changed_lines_count
 
 
 def _escape_cell(value: str) -> str:
-    return value.replace("|", "\\|")
+    # Most cells have no pipe; return them as-is instead of copying.
+    if "|" not in value:
+        return value
+    return value.translate(_PIPE_ESCAPE)
 
 
+@lru_cache(maxsize=None)
 def _env_int(name: str, default: int) -> int:
     raw_value = os.getenv(name)
     if raw_value is None: